@@ -51,6 +51,9 @@ def create_device(rm, resource_name, **kwargs):
     if cls is None:
         raise UnknownInstrumentType(idn)
     new_dev = cls(rm, resource_name, **kwargs)
-    new_dev.connect(resource=dev._resource)
+    # Hand over the already-open resource and the IDN we just read so the
+    # instrument class doesn't have to reopen or re-query it. The resource is
+    # detached from dev first so that it isn't closed when dev is discarded.
+    new_dev.connect(resource=dev._detach_resource(), idn=idn)
     # print(f'Found a {manufacturer} {model}')
     return new_dev
@@ -31,6 +31,7 @@ from PyQt6.QtWidgets import (QAbstractSpinBox,
                              QInputDialog,
                              QLayout,
                              QMenuBar,
+                             QMessageBox,
                              QPlainTextEdit,
                              QPushButton,
                              QStatusBar,
@@ -39,10 +40,27 @@ from PyQt6.QtWidgets import (QAbstractSpinBox,
                              QWidget)
 from PyQt6.QtCore import Qt, QAbstractTableModel, QTimer
 from PyQt6.QtGui import QAction, QColor
-from PyQt6.QtPrintSupport import QPrintDialog
+
+
+# Styles for the menu bars and status bars, selected by the object names given to
+# them below. This is installed once on the QApplication. The QMenu rule keeps the
+# drop-down menus looking the way they did when each menu bar had its own style
+# sheet, which cascaded to them.
+APP_STYLE_SHEET = """
+QMenuBar#InstMenuBar, #InstMenuBar QMenu { margin: 0px; padding: 0px; }
+QStatusBar#InstStatusBar { color: black; background-color: #c0c0c0; font-weight: bold; }
+"""
 
 
 class ConfigureWidgetBase(QWidget):
+    # Configuration menu entries: (label, method name, only shown if the device
+    # supports reset)
+    _MENU_CONFIGURATION = (('&Load...', '_menu_do_load_configuration', False),
+                           ('&Save As...', '_menu_do_save_configuration', False),
+                           ('Reset device to &default', '_menu_do_reset_device', True),
+                           ('&Refresh from instrument',
+                            '_menu_do_refresh_configuration', False))
+
     def __init__(self, main_window, instrument):
         super().__init__()
         self._style_env = main_window._style_env
@@ -71,46 +89,39 @@ class ConfigureWidgetBase(QWidget):
         layoutv.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
 
         self._menubar = QMenuBar()
-        self._menubar.setStyleSheet('margin: 0px; padding: 0px;')
+        self._menubar.setObjectName('InstMenuBar') # Styled by APP_STYLE_SHEET
 
         self._menubar_configure = self._menubar.addMenu('&Configuration')
-        action = QAction('&Load...', self)
-        action.triggered.connect(self._menu_do_load_configuration)
-        self._menubar_configure.addAction(action)
-        action = QAction('&Save As...', self)
-        action.triggered.connect(self._menu_do_save_configuration)
-        self._menubar_configure.addAction(action)
-        if has_reset:
-            action = QAction('Reset device to &default', self)
-            action.triggered.connect(self._menu_do_reset_device)
-            self._menubar_configure.addAction(action)
-        action = QAction('&Refresh from instrument', self)
-        action.triggered.connect(self._menu_do_refresh_configuration)
-        self._menubar_configure.addAction(action)
+        for label, slot, is_reset in self._MENU_CONFIGURATION:
+            if is_reset and not has_reset:
+                continue
+            self._add_menu_action(self._menubar_configure, label, slot)
 
         self._menubar_device = self._menubar.addMenu('&Device')
-        action = QAction('&Rename...', self)
-        action.triggered.connect(self._menu_do_rename_device)
-        self._menubar_device.addAction(action)
+        self._add_menu_action(self._menubar_device, '&Rename...',
+                              '_menu_do_rename_device')
 
         self._menubar_view = self._menubar.addMenu('&View')
 
         self._menubar_help = self._menubar.addMenu('&Help')
-        action = QAction('&About...', self)
-        action.triggered.connect(self._menu_do_about)
-        self._menubar_help.addAction(action)
+        self._add_menu_action(self._menubar_help, '&About...', '_menu_do_about')
 
         layoutv.addWidget(self._menubar)
         central_widget = QWidget()
         layoutv.addWidget(central_widget)
         self._statusbar = QStatusBar()
         self._statusbar.setSizeGripEnabled(False)
-        ss = """color: black; background-color: #c0c0c0; font-weight: bold;"""
-        self._statusbar.setStyleSheet(ss)
+        self._statusbar.setObjectName('InstStatusBar') # Styled by APP_STYLE_SHEET
         layoutv.addWidget(self._statusbar)
 
         return central_widget
 
+    def _add_menu_action(self, menu, label, slot):
+        """Add an action to a menu that calls the named method when triggered."""
+        action = QAction(label, self)
+        action.triggered.connect(getattr(self, slot))
+        menu.addAction(action)
+
     def _menu_do_refresh_configuration(self):
         self.refresh()
 
@@ -174,6 +185,9 @@ class PrintableTextDialog(QDialog):
 
     def _on_print(self):
         """Handle PRINT button."""
+        # QtPrintSupport is only needed here, so don't load it until the user
+        # actually asks to print
+        from PyQt6.QtPrintSupport import QPrintDialog
         pr = QPrintDialog()
         if pr.exec():
             self._text_widget.print(pr.printer())
@@ -22,9 +22,54 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ################################################################################
 
+import contextlib
+import weakref
+
 import pyvisa
 
 
+# Masks of the bits that are not allowed to be set in 1-, 8-, and 16-bit values
+_INVALID_BITS_1 = ~0x1
+_INVALID_BITS_8 = ~0xFF
+_INVALID_BITS_16 = ~0xFFFF
+# Number of times to try opening a VISA resource
+_CONNECT_ATTEMPTS = 3
+
+# The maximum number of commands or queries sent as one compound command by
+# batched() and query_multiple(), to keep it well within an instrument's input
+# buffer
+_MAX_CMDS_PER_TRANSFER = 16
+
+# I/O methods that are replaced by printing versions when debugging is on, and the
+# classes that do the replacing (see _debug_class)
+_DEBUG_CLASSES = {}
+_DEBUG_METHODS = {'query': '_query_debug',
+                  'read': '_read_debug',
+                  'read_raw': '_read_raw_debug',
+                  '_write': '_write_debug',
+                  'write_raw': '_write_raw_debug'}
+
+
+def _close_visa_resource(resource):
+    """Close a VISA resource, ignoring errors from a session that's already gone."""
+    try:
+        resource.close()
+    except (AttributeError, pyvisa.errors.VisaIOError):
+        pass
+
+
+def _debug_class(cls):
+    """Return the subclass of cls whose I/O methods print what they do."""
+    debug_cls = _DEBUG_CLASSES.get(cls)
+    if debug_cls is None:
+        attrs = {name: getattr(cls, debug_name)
+                 for name, debug_name in _DEBUG_METHODS.items()}
+        attrs['_debug_base'] = cls
+        debug_cls = type(f'{cls.__name__}Debug', (cls,), attrs)
+        _DEBUG_CLASSES[cls] = debug_cls
+    return debug_cls
+
+
 class NotConnectedError(Exception):
     pass
 
@@ -35,12 +80,17 @@ class ContactLostError(Exception):
 
 class Device(object):
     """Class representing any generic device accessible through VISA."""
+    # The class without debugging, for the subclasses made by _debug_class
+    _debug_base = None
+
     def __init__(self, resource_manager, resource_name, *args, **kwargs):
         self._resource_manager = resource_manager
         self._resource_name = resource_name
         self._long_name = resource_name
         self._name = resource_name
         self._resource = None
+        # Closes the resource if this object is discarded while still connected
+        self._resource_finalizer = None
         self._connected = False
         self._manufacturer = None
         self._model = None
@@ -48,6 +98,8 @@ class Device(object):
         self._firmware_version = None
         self._hardware_version = None
         self._debug = False
+        self._batching = False
+        self._pending_writes = []
 
     @property
     def manufacturer(self):
@@ -86,7 +138,16 @@ class Device(object):
         return self._resource_name
 
     def set_debug(self, val):
+        """Turn printing of all VISA traffic on or off.
+
+        Rather than testing a flag on every operation, this instance is switched
+        to a subclass whose I/O methods print what they do. Swapping the class
+        rather than storing bound methods on the instance keeps it from referring
+        to itself, so it's still freed (and its resource closed) as soon as it's
+        dropped."""
         self._debug = val
+        base = self._debug_base or type(self)
+        self.__class__ = _debug_class(base) if val else base
 
     def connect(self, resource=None):
         """Open the connection to the device."""
@@ -95,9 +156,21 @@ class Device(object):
         if resource is not None:
             self._resource = resource
         else:
-            self._resource = self._resource_manager.open_resource(self._resource_name)
+            # The retries are deliberately immediate so the GUI thread never blocks
+            for attempt in range(_CONNECT_ATTEMPTS):
+                try:
+                    rm = self._resource_manager
+                    self._resource = rm.open_resource(self._resource_name)
+                    break
+                except pyvisa.errors.VisaIOError:
+                    if attempt == _CONNECT_ATTEMPTS-1:
+                        raise
             self._resource.read_termination = '\n'
             self._resource.write_termination = '\n'
+        # Make sure the session is released even if we're never disconnected, so
+        # that programs that create many devices don't run out of sessions
+        self._resource_finalizer = weakref.finalize(self, _close_visa_resource,
+                                                    self._resource)
         self._connected = True
         if self._debug:
             print(f'Connected to {self._resource_name}')
@@ -122,69 +195,134 @@ class Device(object):
     ### Direct access to pyvisa functions
 
     def disconnect(self):
-        """Close the connection to the device."""
+        """Close the connection to the device. Does nothing if not connected."""
         if not self._connected:
-            raise NotConnectedError
-        try:
-            self._resource.close()
-        except pyvisa.errors.VisaIOError:
-            pass
-        self._connected = False
+            return
+        self._close_resource()
         if self._debug:
             print(f'Disconnected from {self._resource_name}')
 
+    def _close_resource(self):
+        """Close the VISA resource, ignoring errors from a session that's already
+        gone."""
+        resource = self._detach_resource()
+        _close_visa_resource(resource)
+
+    def _detach_resource(self):
+        """Forget the VISA resource without closing it and return it, so that it
+        can be handed to another Device."""
+        self._pending_writes = []
+        self._connected = False
+        if self._resource_finalizer is not None:
+            self._resource_finalizer.detach()
+            self._resource_finalizer = None
+        resource, self._resource = self._resource, None
+        return resource
+
     def query(self, s):
         """VISA query, write then read."""
         if not self._connected:
             raise NotConnectedError
+        self.flush()
         try:
-            ret = self._resource.query(s).strip(' \t\r\n')
+            ret = self._resource.query(s).strip()
         except pyvisa.errors.VisaIOError:
-            self.disconnect()
+            self._close_resource()
             raise ContactLostError
-        if self._debug:
-            print(f'query "{s}" returned "{ret}"')
+        return ret
+
+    def query_multiple(self, queries):
+        """Send a sequence of queries in as few round trips as possible.
+
+        The queries are joined into compound SCPI commands of up to
+        _MAX_CMDS_PER_TRANSFER queries each, and the instrument's ';'-separated
+        responses are returned as a list in the same order."""
+        queries = list(queries)
+        ret = []
+        for i in range(0, len(queries), _MAX_CMDS_PER_TRANSFER):
+            chunk = queries[i:i+_MAX_CMDS_PER_TRANSFER]
+            resp = [x.strip() for x in self.query(';'.join(chunk)).split(';')]
+            if len(resp) != len(chunk):
+                raise ValueError(f'Expected {len(chunk)} responses but got '
+                                 f'{len(resp)}: {resp}')
+            ret.extend(resp)
         return ret
 
     def read(self):
         """VISA read, strips termination characters."""
         if not self._connected:
             raise NotConnectedError
+        self.flush()
         try:
-            ret = self._resource.read().strip(' \t\r\n')
+            ret = self._resource.read().strip()
         except pyvisa.errors.VisaIOError:
-            self.disconnect()
+            self._close_resource()
             raise ContactLostError
-        if self._debug:
-            print(f'read returned "{ret}"')
         return ret
 
     def read_raw(self):
         """VISA read_raw."""
         if not self._connected:
             raise NotConnectedError
+        self.flush()
         try:
             ret = self._resource.read_raw()
         except pyvisa.errors.VisaIOError:
-            self.disconnect()
+            self._close_resource()
             raise ContactLostError
-        if self._debug:
-            print(f'read_raw returned "{ret}"')
         return ret
 
     def write(self, s, timeout=None):
-        """VISA write, appending termination characters. Timeout override is in ms."""
+        """VISA write, appending termination characters. Timeout override is in ms.
+
+        Inside a batched() block, writes without a timeout override are queued and
+        sent later as compound commands."""
         if not self._connected:
             raise NotConnectedError
+        if self._batching and timeout is None:
+            self._pending_writes.append(s)
+            if len(self._pending_writes) >= _MAX_CMDS_PER_TRANSFER:
+                self.flush()
+            return
+        self.flush()
+        self._write(s, timeout)
+
+    def flush(self):
+        """Send any queued writes as a single compound command."""
+        if not self._pending_writes:
+            return
+        s = ';'.join(self._pending_writes)
+        self._pending_writes = []
+        self._write(s)
+
+    @contextlib.contextmanager
+    def batched(self):
+        """Context manager that coalesces the writes inside it into as few transfers
+        as possible."""
+        if self._batching:
+            # Nested batches just join the outer one
+            yield self
+            return
+        self._batching = True
+        try:
+            yield self
+        except BaseException:
+            # Don't send a partial sequence of commands
+            self._pending_writes = []
+            raise
+        finally:
+            self._batching = False
+        self.flush()
+
+    def _write(self, s, timeout=None):
+        """Actually perform a VISA write, bypassing any batching."""
         old_timeout = self._resource.timeout
         if timeout is not None:
             self._resource.timeout = timeout
-        if self._debug:
-            print(f'write "{s}"')
         try:
             self._resource.write(s)
         except pyvisa.errors.VisaIOError:
-            self.disconnect()
+            self._close_resource()
             raise ContactLostError
         self._resource.timeout = old_timeout
 
@@ -192,50 +330,120 @@ class Device(object):
         """VISA write, no termination characters."""
         if not self._connected:
             raise NotConnectedError
-        if self._debug:
-            print(f'write_raw "{s}"')
+        self.flush()
         try:
-            self._resource.write(s)
+            self._resource.write_raw(s)
         except pyvisa.errors.VisaIOError:
-            self.disconnect()
+            self._close_resource()
             raise ContactLostError
 
+    ### Versions of the I/O routines that print what they do; see set_debug
+
+    def _query_debug(self, s):
+        ret = self._debug_base.query(self, s)
+        print(f'query "{s}" returned "{ret}"')
+        return ret
+
+    def _read_debug(self):
+        ret = self._debug_base.read(self)
+        print(f'read returned "{ret}"')
+        return ret
+
+    def _read_raw_debug(self):
+        ret = self._debug_base.read_raw(self)
+        print(f'read_raw returned "{ret}"')
+        return ret
+
+    def _write_debug(self, s, timeout=None):
+        print(f'write "{s}"')
+        self._debug_base._write(self, s, timeout)
+
+    def _write_raw_debug(self, s):
+        print(f'write_raw "{s}"')
+        self._debug_base.write_raw(self, s)
+
     ### Internal support routines
 
-    def _read_write(self, query, write, validator=None, value=None):
+    def _read_write(self, query, write_prefix, validator=None, value=None):
+        """Query a value, or write one if given. write_prefix is the command as
+        bytes including the trailing space."""
+        self.flush()
         if value is None:
             return self._resource.query(query)
         if validator is not None:
             validator(value)
-        self._resource.write(f'{write} {value}')
+        self.write_raw(write_prefix + str(value).encode('ascii') + b'\n')
         return None
 
+    # The validators check that an integer fits in an unsigned field by testing
+    # for any bits outside of it. Negative values always have such bits set.
+
     def _validator_1(self, value):
-        if value < 0 or value > 1:
+        if value & _INVALID_BITS_1:
             raise ValueError
 
     def _validator_8(self, value):
-        if not (0 <= value <= 255): # Should this be 128? Or -128?
+        if value & _INVALID_BITS_8: # Should this be 128? Or -128?
             raise ValueError
 
     def _validator_16(self, value):
-        if not (0 <= value <= 65535):
+        if value & _INVALID_BITS_16:
             raise ValueError
 
 
 class Device4882(Device):
     """Class representing any device that supports IEEE 488.2 commands."""
+    # Pre-encoded command prefixes for _read_write
+    _ESE_PREFIX = b'*ESE '
+    _SRE_PREFIX = b'*SRE '
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._idn = None
 
-    def idn(self):
-        """Read instrument identification."""
-        return self.query('*IDN?')
+    def connect(self, resource=None, idn=None):
+        """Open the connection to the device and read its identification.
+
+        If the IDN string has already been read through the given resource, it can
+        be passed in to avoid querying the instrument for it again."""
+        if self._connected:
+            return
+        super().connect(resource=resource)
+        if idn is None:
+            idn = self.query('*IDN?')
+        self._set_idn(idn)
+
+    def disconnect(self, *args, **kwargs):
+        """Close the connection to the device and forget its identification."""
+        super().disconnect(*args, **kwargs)
+        self._idn = None
+
+    def idn(self, refresh=False):
+        """Read instrument identification.
+
+        The result is cached when connecting; use refresh=True to query the
+        instrument again."""
+        if refresh or self._idn is None:
+            self._set_idn(self.query('*IDN?'))
+        return self._idn
+
+    def _set_idn(self, idn):
+        """Cache the IDN string and the identity fields it contains."""
+        self._idn = idn
+        fields = idn.split(',')
+        (self._manufacturer,
+         self._model,
+         self._serial_number,
+         self._firmware_version,
+         self._hardware_version) = (fields + [None] * 5)[:5]
 
     def rst(self):
         """Return to the instrument's default state."""
-        self.write('*RST')
-        self.cls()
+        self.write_compound('*RST', '*CLS')
+
+    def write_compound(self, *cmds, timeout=None):
+        """Send several commands as a single compound SCPI command."""
+        self.write(';'.join(cmds), timeout=timeout)
 
     def cls(self):
         """Clear all event registers and the error list."""
@@ -243,7 +451,8 @@ class Device4882(Device):
 
     def ese(self, reg_value=None):
         """Read or write the standard event status enable register."""
-        return self._read_write('*ESE?', '*ESE', self._validator_8, reg_value)
+        return self._read_write('*ESE?', self._ESE_PREFIX, self._validator_8,
+                                reg_value)
 
     def esr(self):
         """Read and clear the standard event status enable register."""
@@ -259,7 +468,8 @@ class Device4882(Device):
 
     def sre(self, reg_value=None):
         """Read or write the status byte enable register."""
-        return self._read_write('*SRE?', '*SRE', self._validator_8, reg_value)
+        return self._read_write('*SRE?', self._SRE_PREFIX, self._validator_8,
+                                reg_value)
 
     def stb(self):
         """Reads the status byte event register."""
@@ -100,6 +100,7 @@
 
 import json
 import re
+import sys
 import time
 
 from PyQt6.QtWidgets import (QWidget,
@@ -121,7 +122,7 @@ from PyQt6.QtGui import QAction, QKeySequence, QShortcut
 
 import pyqtgraph as pg
 
-from .device import Device4882
+from .device import ContactLostError, Device4882
 from .config_widget_base import (ConfigureWidgetBase,
                                  DoubleSpinBoxDelegate,
                                  ListTableModel,
@@ -132,6 +133,13 @@ from .config_widget_base import (ConfigureWidgetBase,
 class InstrumentSiglentSDL1000(Device4882):
     """Controller for SDL1000-series devices."""
 
+    # Absolute paths so each query in the compound command stands on its own
+    _VCPR_QUERIES = (':MEAS:VOLT?', ':MEAS:CURR?', ':MEAS:POW?', ':MEAS:RES?')
+    _BATTERY_QUERIES = (':BATTERY:DISCHA:TIMER?', ':BATTERY:DISCHA:CAP?',
+                        ':BATTERY:ADDCAP?')
+    _TRISE_QUERY = ':TIME:TEST:RISE?'
+    _TFALL_QUERY = ':TIME:TEST:FALL?'
+
     @classmethod
     def idn_mapping(cls):
         return {
@@ -158,24 +166,28 @@ class InstrumentSiglentSDL1000(Device4882):
     def connect(self, *args, **kwargs):
         """Connect to the instrument and set it to remote state."""
         super().connect(*args, **kwargs)
-        idn = self.idn().split(',')
-        if len(idn) != 4:
-            assert ValueError
-        (self._manufacturer,
-         self._model,
-         self._serial_number,
-         self._firmware_version) = idn
-        if self._manufacturer != 'Siglent Technologies':
-            assert ValueError
-        if not self._model.startswith('SDL'):
-            assert ValueError
+        # The identity fields were filled in from the *IDN? response by connect()
+        if (len(self._idn.split(',')) != 4 or
+                self._manufacturer != 'Siglent Technologies' or
+                not self._model.startswith('SDL')):
+            idn = self._idn
+            # Don't use our own disconnect(), which would send an SDL command to
+            # whatever this instrument is
+            super().disconnect()
+            raise ValueError(f'Not a Siglent SDL1000 load: manufacturer '
+                             f'"{self._manufacturer}", model "{self._model}" '
+                             f'(IDN "{idn}")')
         self._long_name = f'{self._model} @ {self._resource_name}'
         self._max_power = 300 if self._model in ('SDL1030X-E', 'SDL1030X') else 200
         self.write(':SYST:REMOTE:STATE 1') # Lock the keyboard
 
     def disconnect(self, *args, **kwargs):
         """Disconnect from the instrument and turn off its remote state."""
-        self.write(':SYST:REMOTE:STATE 0')
+        if self._connected:
+            try:
+                self.write(':SYST:REMOTE:STATE 0')
+            except ContactLostError:
+                pass
         super().disconnect(*args, **kwargs)
 
     def configure_widget(self, main_window):
@@ -201,11 +213,11 @@ class InstrumentSiglentSDL1000(Device4882):
 
     def measure_trise(self):
         """Return the measured Trise as a float."""
-        return float(self.query('TIME:TEST:RISE?'))
+        return float(self.query(self._TRISE_QUERY))
 
     def measure_tfall(self):
         """Return the measured Tfall as a float."""
-        return float(self.query('TIME:TEST:FALL?'))
+        return float(self.query(self._TFALL_QUERY))
 
     def measure_resistance(self):
         """Return the measured resistance as a float."""
@@ -225,10 +237,19 @@ class InstrumentSiglentSDL1000(Device4882):
 
     def measure_vcpr(self):
         """Return measured Voltage, Current, Power, and Resistance."""
-        return (self.measure_voltage(),
-                self.measure_current(),
-                self.measure_power(),
-                self.measure_resistance())
+        return tuple(float(x) for x in self.query_multiple(self._VCPR_QUERIES))
+
+    def measure_battery(self):
+        """Return the battery discharge time (s), capacity (Ah), and additional
+        capacity (Ah)."""
+        return self._battery_from_responses(self.query_multiple(self._BATTERY_QUERIES))
+
+    @staticmethod
+    def _battery_from_responses(responses):
+        """Convert the responses to _BATTERY_QUERIES to the discharge time (s),
+        capacity (Ah), and additional capacity (Ah)."""
+        disch_time, disch_cap, add_cap = (float(x) for x in responses)
+        return disch_time, disch_cap / 1000, add_cap / 1000
 
 
 ##########################################################################################
@@ -296,8 +317,8 @@ _STYLE_SHEET = {
 
 # This dictionary maps from the "overall" mode (shown in the left radio button group)
 # to the set of widgets that should be shown or hidden.
-#   !   means hide
-#   ~   means set as not enabled (greyed out)
+#   ~   means hide
+#   !   means set as not enabled (greyed out)
 #       No prefix means show and enable
 # Basically, the Dynamic modes (continuous, pulse, trigger) are only available in
 # Dynamic mode, and the Constant X modes are only available in Basic, Dynamic,
@@ -316,6 +337,24 @@ _SDL_OVERALL_MODES = {
                    '~ListRow'),
 }
 
+# This dictionary maps from the value returned by :FUNCTION:MODE? to the overall
+# mode name used in the GUI. LED mode is reported as BASIC and is handled
+# separately.
+_SDL_FUNCTION_MODE_TO_OVERALL_MODE = {
+    'BASIC':   'Basic',
+    'TRAN':    'Dynamic',
+    'BATTERY': 'Battery',
+    'OCP':     'OCPT',
+    'OPP':     'OPPT',
+    'LIST':    'List',
+    'PROGRAM': 'Program'
+}
+
+# Parameters whose writes switch the SDL to a different mode. The SDL crashes if
+# it's sent parameters for a mode it's not in, so a write to one of these is always
+# flushed on its own rather than sent in a compound command with what follows it.
+_SDL_MODE_SELECT_PARAMS = frozenset((':FUNCTION', ':FUNCTION:TRANSIENT', ':EXT:MODE'))
+
 # This dictionary maps from the current overall mode (see above) and the current
 # "Constant X" mode (if any, None otherwise) to a description of what to do
 # in this combination.
@@ -737,6 +776,184 @@ _SDL_MODE_PARAMS = {  # noqa: E121,E501
 }
 
 
+def _scpi_cmds_from_param_info(param_info, param_spec):
+    """Create a SCPI command from a param_info structure."""
+    mode_name = param_info['mode_name']
+    if mode_name is None: # General parameters
+        mode_name = ''
+    else:
+        mode_name = f':{mode_name}:'
+    if isinstance(param_spec[0], (tuple, list)):
+        ps1, ps2 = param_spec[0]
+        if ps1[0] == ':':
+            mode_name = ''
+        return f'{mode_name}{ps1}', f'{mode_name}{ps2}'
+    ps1 = param_spec[0]
+    if ps1[0] == ':':
+        mode_name = ''
+    return f'{mode_name}{ps1}', None
+
+
+def _int_from_response(val):
+    """Convert a numeric query response (which may be formatted as a float) to an int."""
+    return int(float(val))
+
+
+# How refresh() converts a query response to its _param_state value for each
+# parameter type
+_SDL_PARAM_CONVERTERS = {
+    'f': float,              # Float
+    'b': _int_from_response, # Boolean
+    'd': _int_from_response, # Decimal
+    's': str.upper,          # String
+    'r': str.upper,          # Radio button
+}
+
+
+def _refresh_params():
+    """Build the list of all parameters that refresh() reads from the instrument.
+
+    Returns a tuple of (param0, param_type, converter, param1) entries, where
+    converter is from _SDL_PARAM_CONVERTERS and param1 is the associated Boolean
+    flag or None, and the list of all queries to send. The
+    queries are in the same order as the entries, with param1's query (if any)
+    immediately following param0's, so the responses can be consumed in order."""
+    params = {}
+    queries = []
+    for info in _SDL_MODE_PARAMS.values():
+        for param_spec in info['params']:
+            param0, param1 = _scpi_cmds_from_param_info(info, param_spec)
+            # Interned so the _param_state keys are the same string objects as the
+            # ones in the widget parameter tables
+            param0 = sys.intern(param0)
+            if param1 is not None:
+                param1 = sys.intern(param1)
+            if param0 in params:
+                # Sub-modes often ask for the same data, no need to retrieve it twice
+                # And we will have already taken care of param1 the previous time
+                # as well
+                continue
+            param_type = param_spec[1][-1]
+            params[param0] = (param0, param_type, _SDL_PARAM_CONVERTERS[param_type],
+                              param1)
+            queries.append(f'{param0}?')
+            if param1 is not None:
+                queries.append(f'{param1}?')
+    return tuple(params.values()), tuple(queries)
+
+
+def _parse_widget_list(widget_list):
+    """Convert a widget list as described above into (action, RE) pairs.
+
+    The action is 'hide', 'disable', or 'show'."""
+    if widget_list is None:
+        return ()
+    ret = []
+    for widget_re in widget_list:
+        match widget_re[0]:
+            case '~':
+                ret.append(('hide', widget_re[1:]))
+            case '!':
+                ret.append(('disable', widget_re[1:]))
+            case _:
+                ret.append(('show', widget_re))
+    return tuple(ret)
+
+
+def _compile_widget_actions(widget_actions):
+    """Compile a sequence of (action, RE) pairs into (action, compiled RE) pairs.
+
+    Consecutive entries with the same action are combined into a single alternation
+    RE so that each run of them is handled with one pass over the widgets. The order
+    of the different actions is preserved."""
+    runs = []
+    for action, widget_re in widget_actions:
+        if runs and runs[-1][0] == action:
+            runs[-1][1].append(widget_re)
+        else:
+            runs.append((action, [widget_re]))
+    ret = []
+    for action, widget_res in runs:
+        if len(widget_res) == 1:
+            # Left as is so that a plain widget name can be recognized as one
+            widget_re = widget_res[0]
+        else:
+            widget_re = '|'.join(f'(?:{x})' for x in widget_res)
+        ret.append((action, re.compile(widget_re)))
+    return tuple(ret)
+
+
+def _widget_params(param_info):
+    """Parse the parameter list of a param_info structure for _update_widgets.
+
+    Returns a tuple of (full_scpi_cmd, param_type, decimals, widget_label,
+    widget_main, min_val, max_val) entries. The full SCPI command is interned so
+    the same string (with its cached hash) is used for every _param_state lookup.
+    decimals is only set for floating point parameters, and min_val and max_val are
+    None when there is no value range. Fixed minimum values are resolved here; the
+    rest depend on the current state and are resolved by _update_widgets."""
+    ret = []
+    for param_spec in param_info['params']:
+        full_scpi_cmd = sys.intern(_scpi_cmds_from_param_info(param_info,
+                                                              param_spec)[0])
+        param_full_type = param_spec[1]
+        param_type = param_full_type[-1]
+        decimals = None
+        if param_type == 'f':
+            assert param_full_type[0] == '.'
+            decimals = int(param_full_type[1:-1])
+        rest = param_spec[2:]
+        min_val = max_val = None
+        match len(rest):
+            case 1:
+                # For General, these parameters don't have associated widgets
+                assert rest[0] in (False, True)
+                widget_label = None
+                widget_main = None
+            case 2:
+                # Just a label and main widget, no value range
+                widget_label, widget_main = rest
+            case 4:
+                # A label and main widget with min/max value
+                widget_label, widget_main, min_val, max_val = rest
+                if min_val in ('C', 'V', 'P'):
+                    min_val = 0
+                elif min_val == 'S':
+                    min_val = 0.001
+            case _:
+                assert False, f'Unknown widget parameters {rest}'
+        ret.append((full_scpi_cmd, param_type, decimals, widget_label, widget_main,
+                    min_val, max_val))
+    return tuple(ret)
+
+
+# The widget lists are parsed and their REs compiled once here so that mode changes
+# don't have to do it.
+_SDL_OVERALL_MODE_WIDGET_ACTIONS = {mode: _parse_widget_list(widget_list)
+                                    for mode, widget_list in _SDL_OVERALL_MODES.items()}
+for _info in _SDL_MODE_PARAMS.values():
+    _info['widget_actions'] = _parse_widget_list(_info['widgets'])
+    _info['widget_params'] = _widget_params(_info)
+# For each mode combination, the complete sequence of widget actions to perform on
+# entering it: the overall mode's, then the General ones, then the mode's own (if
+# any), in that order so that later entries override earlier ones.
+for _key, _info in _SDL_MODE_PARAMS.items():
+    if _key != 'General':
+        _info['all_widget_actions'] = _compile_widget_actions(
+            _SDL_OVERALL_MODE_WIDGET_ACTIONS[_key[0]] +
+            _SDL_MODE_PARAMS['General']['widget_actions'] +
+            _info['widget_actions'])
+
+_SDL_REFRESH_PARAMS, _SDL_REFRESH_QUERIES = _refresh_params()
+
+# Compiled REs for the radio button groups named in the 'r' parameters
+_SDL_RADIO_RES = {}
+for _info in _SDL_MODE_PARAMS.values():
+    for _param_spec in _info['params']:
+        if _param_spec[1] == 'r' and len(_param_spec) > 3:
+            _SDL_RADIO_RES[_param_spec[3]] = re.compile(_param_spec[3])
+
+
 # This class encapsulates the main SDL configuration widget.
 
 class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
@@ -783,6 +1000,18 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
         # the callback handler for it.
         self._disable_callbacks = False
 
+        # Set when a widget update has been scheduled for the next pass through the
+        # event loop; see _schedule_update_widgets
+        self._update_widgets_pending = False
+
+        # Cache of the registry widgets matching each compiled widget RE; see
+        # _widgets_matching
+        self._widget_re_matches = {}
+
+        # The Overall Mode and Constant Mode radio buttons, indexed by mode name
+        self._overall_mode_rbs = {}
+        self._const_mode_rbs = {}
+
         # The time the LOAD was turned on and off. Used for battery discharge logging.
         self._load_on_time = None
         self._load_off_time = None
@@ -807,37 +1036,21 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
     def refresh(self):
         """Read all parameters from the instrument and set our internal state to match."""
         self._param_state = {} # Start with a blank slate
-        for mode, info in _SDL_MODE_PARAMS.items():
-            for param_spec in info['params']:
-                param0, param1 = self._scpi_cmds_from_param_info(info, param_spec)
-                if param0 in self._param_state:
-                    # Sub-modes often ask for the same data, no need to retrieve it twice
-                    # And we will have already taken care of param1 the previous time
-                    # as well
-                    continue
-                val = self._inst.query(f'{param0}?')
-                param_type = param_spec[1][-1]
-                match param_type:
-                    case 'f': # Float
-                        val = float(val)
-                    case 'b' | 'd': # Boolean or Decimal
-                        val = int(float(val))
-                    case 's' | 'r': # String or radio button
-                        val = val.upper()
-                    case _:
-                        assert False, f'Unknown param_type {param_type}'
-                self._param_state[param0] = val
-                if param1 is not None:
-                    # A Boolean flag associated with param0
-                    # We let the flag override the previous value
-                    val1 = int(float(self._inst.query(f'{param1}?')))
-                    self._param_state[param1] = val1
-                    if not val1 and self._param_state[param0] != 0:
-                        if param_type == 'f':
-                            self._param_state[param0] = 0.
-                        else:
-                            self._param_state[param0] = 0
-                        self._inst.write(f'{param0} 0')
+        # The responses are in the same order as _SDL_REFRESH_PARAMS
+        responses = iter(self._inst.query_multiple(_SDL_REFRESH_QUERIES))
+        for param0, param_type, converter, param1 in _SDL_REFRESH_PARAMS:
+            self._param_state[param0] = converter(next(responses))
+            if param1 is not None:
+                # A Boolean flag associated with param0
+                # We let the flag override the previous value
+                val1 = _int_from_response(next(responses))
+                self._param_state[param1] = val1
+                if not val1 and self._param_state[param0] != 0:
+                    if param_type == 'f':
+                        self._param_state[param0] = 0.
+                    else:
+                        self._param_state[param0] = 0
+                    self._inst.write(f'{param0} 0')
 
         # Special read of the List Mode parameters
         self._update_list_mode_from_instrument()
@@ -860,44 +1073,95 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
         first_list_mode_write = True
         for mode, info in _SDL_MODE_PARAMS.items():
             first_write = True
-            for param_spec in info['params']:
-                if param_spec[2] is False:
-                    continue # The General False flag, all others are written
-                param0, param1 = self._scpi_cmds_from_param_info(info, param_spec)
-                if param0 in set_params:
-                    # Sub-modes often ask for the same data, no need to retrieve it twice
-                    continue
-                set_params.add(param0)
-                if first_write and info['mode_name']:
-                    first_write = False
-                    # We have to put the instrument in the correct mode before setting
-                    # the parameters. Not necessary for "General" (mode_name None).
-                    self._put_inst_in_mode(mode[0], mode[1])
-                self._update_one_param_on_inst(param0, self._param_state[param0])
-                if param1 is not None:
-                    self._update_one_param_on_inst(param1, self._param_state[param1])
-            if info['mode_name'] == 'LIST' and first_list_mode_write:
-                first_list_mode_write = False
-                # Special write of the List Mode parameters
-                steps = self._param_state[':LIST:STEP']
-                for i in range(1, steps+1):
-                    self._inst.write(f':LIST:LEVEL {i},{self._list_mode_levels[i-1]:.3f}')
-                    self._inst.write(f':LIST:WIDTH {i},{self._list_mode_widths[i-1]:.3f}')
-                    self._inst.write(f':LIST:SLEW {i},{self._list_mode_slews[i-1]:.3f}')
+            # Each mode's commands are batched into as few transfers as possible
+            with self._inst.batched():
+                for param_spec in info['params']:
+                    if param_spec[2] is False:
+                        continue # The General False flag, all others are written
+                    param0, param1 = self._scpi_cmds_from_param_info(info, param_spec)
+                    if param0 in set_params:
+                        # Sub-modes often ask for the same data, no need to retrieve
+                        # it twice
+                        continue
+                    set_params.add(param0)
+                    if first_write and info['mode_name']:
+                        first_write = False
+                        # We have to put the instrument in the correct mode before
+                        # setting the parameters. Not necessary for "General"
+                        # (mode_name None).
+                        self._put_inst_in_mode(mode[0], mode[1])
+                    self._update_one_param_on_inst(param0, self._param_state[param0])
+                    if param1 is not None:
+                        self._update_one_param_on_inst(param1,
+                                                       self._param_state[param1])
+                if info['mode_name'] == 'LIST' and first_list_mode_write:
+                    first_list_mode_write = False
+                    # Special write of the List Mode parameters
+                    steps = self._param_state[':LIST:STEP']
+                    for i in range(1, steps+1):
+                        self._inst.write(
+                            f':LIST:LEVEL {i},{self._list_mode_levels[i-1]:.3f}')
+                        self._inst.write(
+                            f':LIST:WIDTH {i},{self._list_mode_widths[i-1]:.3f}')
+                        self._inst.write(
+                            f':LIST:SLEW {i},{self._list_mode_slews[i-1]:.3f}')
 
         self._update_state_from_param_state()
         self._put_inst_in_mode(self._cur_overall_mode, self._cur_const_mode)
 
     def update_measurements_and_triggers(self, read_inst=True):
         """Read current values, update control panel display, return the values."""
-        # Update the load on/off state in case we hit a protection limit
         input_state = 0
         if read_inst:
-            input_state = int(self._inst.query(':INPUT:STATE?'))
+            # Update the load on/off state in case we hit a protection limit. This
+            # is read on its own so that a garbled measurement reply can't keep us
+            # from noticing the load turning off.
+            try:
+                input_state = int(self._inst.query(':INPUT:STATE?'))
+            except ValueError:
+                # Skip this reading rather than letting the exception escape from
+                # the measurement timer
+                input_state = self._param_state[':INPUT:STATE']
+                read_inst = False
             if self._param_state[':INPUT:STATE'] != input_state:
                 # No need to update the instrument, since it changed the state for us
                 self._update_load_state(input_state, update_inst=False)
 
+        if read_inst:
+            # Read all enabled measurements in a single round trip. Current, power,
+            # resistance, Trise and Tfall are only available when the load is on.
+            inst = self._inst
+            v_query, c_query, p_query, r_query = inst._VCPR_QUERIES
+            queries = []
+            if self._enable_measurement_v:
+                queries.append(v_query)
+            if input_state:
+                if self._enable_measurement_c:
+                    queries.append(c_query)
+                if self._enable_measurement_p:
+                    queries.append(p_query)
+                if self._enable_measurement_r:
+                    queries.append(r_query)
+                if self._enable_measurement_trise:
+                    queries.append(inst._TRISE_QUERY)
+                if self._enable_measurement_tfall:
+                    queries.append(inst._TFALL_QUERY)
+            batt_mode = self._cur_overall_mode == 'Battery'
+            if batt_mode:
+                queries.extend(inst._BATTERY_QUERIES)
+            try:
+                responses = dict(zip(queries, inst.query_multiple(queries)))
+                vals = {query: float(response)
+                        for query, response in responses.items()
+                        if query not in inst._BATTERY_QUERIES}
+                if batt_mode:
+                    batt_vals = inst._battery_from_responses(
+                        [responses[query] for query in inst._BATTERY_QUERIES])
+            except ValueError:
+                # A garbled response - skip the measurements this time, but keep
+                # the load state we just read
+                read_inst = False
+
         measurements = {}
         triggers = {}
 
@@ -911,7 +1175,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
             w = self._widget_registry['MeasureV']
             if self._enable_measurement_v:
                 # Voltage is available regardless of the input state
-                voltage = self._inst.measure_voltage()
+                voltage = vals[v_query]
                 w.setText(f'{voltage:10.6f} V')
             else:
                 w.setText('---   V')
@@ -928,7 +1192,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
                 if not input_state:
                     w.setText('N/A   A')
                 else:
-                    current = self._inst.measure_current()
+                    current = vals[c_query]
                     w.setText(f'{current:10.6f} A')
             else:
                 w.setText('---   A')
@@ -945,7 +1209,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
                 if not input_state:
                     w.setText('N/A   W')
                 else:
-                    power = self._inst.measure_power()
+                    power = vals[p_query]
                     w.setText(f'{power:10.6f} W')
             else:
                 w.setText('---   W')
@@ -962,7 +1226,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
                 if not input_state:
                     w.setText('N/A   \u2126')
                 else:
-                    resistance = self._inst.measure_resistance()
+                    resistance = vals[r_query]
                     if resistance < 10:
                         fmt = '%8.6f'
                     elif resistance < 100:
@@ -991,7 +1255,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
                 if not input_state:
                     w.setText('TRise:   N/A   s')
                 else:
-                    trise = self._inst.measure_trise()
+                    trise = vals[inst._TRISE_QUERY]
                     w.setText(f'TRise: {trise:7.3f} s')
             else:
                 w.setText('TRise:   ---   s')
@@ -1008,7 +1272,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
                 if not input_state:
                     w.setText('TFall:   N/A   s')
                 else:
-                    tfall = self._inst.measure_tfall()
+                    tfall = vals[inst._TFALL_QUERY]
                     w.setText(f'TFall: {tfall:7.3f} s')
             else:
                 w.setText('TFall:   ---   s')
@@ -1022,22 +1286,20 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
         add_cap = None
         total_cap = None
         if read_inst:
-            if self._cur_overall_mode == 'Battery':
+            if batt_mode:
                 # Battery measurements are available regardless of load state
                 if self._batt_log_initial_voltage is None:
                     self._batt_log_initial_voltage = voltage
-                disch_time = self._inst.measure_battery_time()
+                disch_time, disch_cap, add_cap = batt_vals
                 m, s = divmod(disch_time, 60)
                 h, m = divmod(m, 60)
                 w = self._widget_registry['MeasureBattTime']
                 w.setText(f'{int(h):02d}:{int(m):02d}:{int(s):02}')
 
                 w = self._widget_registry['MeasureBattCap']
-                disch_cap = self._inst.measure_battery_capacity()
                 w.setText(f'{disch_cap:7.3f} Ah')
 
                 w = self._widget_registry['MeasureBattAddCap']
-                add_cap = self._inst.measure_battery_add_capacity()
                 w.setText(f'Addl Cap: {add_cap:7.3f} Ah')
 
                 # When the LOAD is OFF, we have already updated the ADDCAP to include the
@@ -1157,6 +1419,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
             rb.wid = mode
             rb.toggled.connect(self._on_click_overall_mode)
             self._widget_registry['Overall_'+mode] = rb
+            self._overall_mode_rbs[mode] = rb
         layoutv.addStretch()
         # Right column
         layoutv = QVBoxLayout()
@@ -1170,6 +1433,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
             rb.wid = mode
             rb.toggled.connect(self._on_click_overall_mode)
             self._widget_registry['Overall_'+mode] = rb
+            self._overall_mode_rbs[mode] = rb
             if mode == 'Dynamic':
                 bg2 = QButtonGroup(layouts)
                 for mode in ('Continuous', 'Pulse', 'Toggle'):
@@ -1200,6 +1464,7 @@ class InstrumentSiglentSDL1000ConfigureWidget(ConfigureWidgetBase):
             rb.sizePolicy().setRetainSizeWhenHidden(True)
             rb.toggled.connect(self._on_click_const_mode)
             self._widget_registry['Const_'+mode] = rb
+            self._const_mode_rbs[mode] = rb
             layoutv.addWidget(rb)
 
         ### ROW 1, COLUMN 3 ###
@@ -1830,93 +2095,96 @@ Connected to {self._inst.resource_name}
         self._cur_dynamic_mode = None
         new_param_state = {}
         new_param_state[':EXT:MODE'] = 'INT'  # Overridden by 'Ext' below
-        # Special handling for each button
-        match self._cur_overall_mode:
-            case 'Basic':
-                self._cur_const_mode = self._param_state[':FUNCTION'].title()
-                if self._cur_const_mode in ('Led', 'OCP', 'OPP'):
-                    # LED is weird in that the instrument treats it as a BASIC mode
-                    # but there's no CV/CC/CP/CR choice.
-                    # We lose information going from OCP/OPP back to Basic because
-                    # we don't know which basic mode we were in before!
-                    self._cur_const_mode = 'Voltage' # For lack of anything else to do
-                # Force update since this does more than set a parameter - it switches
-                # modes
-                self._param_state[':FUNCTION'] = None
-                new_param_state[':FUNCTION'] = self._cur_const_mode.upper()
-                self._param_state[':FUNCTION:MODE'] = 'BASIC'
-            case 'Dynamic':
-                self._cur_const_mode = (
-                    self._param_state[':FUNCTION:TRANSIENT'].title())
-                # Dynamic also has sub-modes - Continuous, Pulse, Toggle
-                param_info = self._cur_mode_param_info(null_dynamic_mode_ok=True)
-                mode_name = param_info['mode_name']
-                self._cur_dynamic_mode = (
-                    self._param_state[f':{mode_name}:TRANSIENT:MODE'].title())
-                # Force update since this does more than set a parameter - it switches
-                # modes
-                self._param_state[':FUNCTION:TRANSIENT'] = None
-                new_param_state[':FUNCTION:TRANSIENT'] = self._cur_const_mode.upper()
-                self._param_state[':FUNCTION:MODE'] = 'TRAN'
-            case 'LED':
-                # Force update since this does more than set a parameter - it switches
-                # modes
-                self._param_state[':FUNCTION'] = None
-                new_param_state[':FUNCTION'] = 'LED' # LED is consider a BASIC mode
-                self._param_state[':FUNCTION:MODE'] = 'BASIC'
-                self._cur_const_mode = None
-            case 'Battery':
-                # This is not a parameter with a state - it's just a command to switch
-                # modes. The normal :FUNCTION tells us we're in the Battery mode, but it
-                # doesn't allow us to SWITCH TO the Battery mode!
-                self._inst.write(':BATTERY:FUNC')
-                self._param_state[':FUNCTION:MODE'] = 'BATTERY'
-                self._cur_const_mode = self._param_state[':BATTERY:MODE'].title()
-            case 'OCPT':
-                # This is not a parameter with a state - it's just a command to switch
-                # modes. The normal :FUNCTION tells us we're in OCP mode, but it
-                # doesn't allow us to SWITCH TO the OCP mode!
-                self._inst.write(':OCP:FUNC')
-                self._param_state[':FUNCTION:MODE'] = 'OCP'
-                self._cur_const_mode = None
-            case 'OPPT':
-                # This is not a parameter with a state - it's just a command to switch
-                # modes. The normal :FUNCTION tells us we're in OPP mode, but it
-                # doesn't allow us to SWITCH TO the OPP mode!
-                self._inst.write(':OPP:FUNC')
-                self._param_state[':FUNCTION:MODE'] = 'OPP'
-                self._cur_const_mode = None
-            case 'Ext \u26A0':
-                # EXTI and EXTV are really two different modes, but we treat them
-                # as one for consistency. Unfortunately that means when the user switches
-                # to "EXT" mode, you don't know whether they actually want V or I,
-                # so we just assume V.
-                self._cur_const_mode = 'Voltage'
-                new_param_state[':EXT:MODE'] = 'EXTV'
-            case 'List':
-                # This is not a parameter with a state - it's just a command to switch
-                # modes. The normal :FUNCTION tells us we're in List mode, but it
-                # doesn't allow us to SWITCH TO the List mode!
-                self._inst.write(':LIST:STATE:ON')
-                self._param_state[':FUNCTION:MODE'] = 'LIST'
-                self._cur_const_mode = self._param_state[':LIST:MODE'].title()
-            case 'Program':
-                # This is not a parameter with a state - it's just a command to switch
-                # modes. The normal :FUNCTION tells us we're in List mode, but it
-                # doesn't allow us to SWITCH TO the List mode!
-                self._inst.write(':PROGRAM:STATE:ON')
-                self._param_state[':FUNCTION:MODE'] = 'PROGRAM'
-                self._cur_const_mode = None
-
-        # Changing the mode turns off the load and short.
-        # We have to do this manually in order for the later mode change to take effect.
-        # If you try to change mode while the load is on, the SDL turns off the load,
-        # but then ignores the mode change.
-        self._update_load_state(0)
-        self._update_short_state(0)
+        # The mode switch, load/short off, and parameter writes all go to the
+        # instrument in a single transfer
+        with self._inst.batched():
+            # Special handling for each button
+            match self._cur_overall_mode:
+                case 'Basic':
+                    self._cur_const_mode = self._param_state[':FUNCTION'].title()
+                    if self._cur_const_mode in ('Led', 'Ocp', 'Opp'):
+                        # LED is weird in that the instrument treats it as a BASIC mode
+                        # but there's no CV/CC/CP/CR choice.
+                        # We lose information going from OCP/OPP back to Basic because
+                        # we don't know which basic mode we were in before!
+                        self._cur_const_mode = 'Voltage' # For lack of anything else to do
+                    # Force update since this does more than set a parameter - it switches
+                    # modes
+                    self._param_state[':FUNCTION'] = None
+                    new_param_state[':FUNCTION'] = self._cur_const_mode.upper()
+                    self._param_state[':FUNCTION:MODE'] = 'BASIC'
+                case 'Dynamic':
+                    self._cur_const_mode = (
+                        self._param_state[':FUNCTION:TRANSIENT'].title())
+                    # Dynamic also has sub-modes - Continuous, Pulse, Toggle
+                    param_info = self._cur_mode_param_info(null_dynamic_mode_ok=True)
+                    mode_name = param_info['mode_name']
+                    self._cur_dynamic_mode = (
+                        self._param_state[f':{mode_name}:TRANSIENT:MODE'].title())
+                    # Force update since this does more than set a parameter - it switches
+                    # modes
+                    self._param_state[':FUNCTION:TRANSIENT'] = None
+                    new_param_state[':FUNCTION:TRANSIENT'] = self._cur_const_mode.upper()
+                    self._param_state[':FUNCTION:MODE'] = 'TRAN'
+                case 'LED':
+                    # Force update since this does more than set a parameter - it switches
+                    # modes
+                    self._param_state[':FUNCTION'] = None
+                    new_param_state[':FUNCTION'] = 'LED' # LED is consider a BASIC mode
+                    self._param_state[':FUNCTION:MODE'] = 'BASIC'
+                    self._cur_const_mode = None
+                case 'Battery':
+                    # This is not a parameter with a state - it's just a command to
+                    # switch modes. The normal :FUNCTION tells us we're in the Battery
+                    # mode, but it doesn't allow us to SWITCH TO the Battery mode!
+                    self._write_mode_select(':BATTERY:FUNC')
+                    self._param_state[':FUNCTION:MODE'] = 'BATTERY'
+                    self._cur_const_mode = self._param_state[':BATTERY:MODE'].title()
+                case 'OCPT':
+                    # This is not a parameter with a state - it's just a command to switch
+                    # modes. The normal :FUNCTION tells us we're in OCP mode, but it
+                    # doesn't allow us to SWITCH TO the OCP mode!
+                    self._write_mode_select(':OCP:FUNC')
+                    self._param_state[':FUNCTION:MODE'] = 'OCP'
+                    self._cur_const_mode = None
+                case 'OPPT':
+                    # This is not a parameter with a state - it's just a command to switch
+                    # modes. The normal :FUNCTION tells us we're in OPP mode, but it
+                    # doesn't allow us to SWITCH TO the OPP mode!
+                    self._write_mode_select(':OPP:FUNC')
+                    self._param_state[':FUNCTION:MODE'] = 'OPP'
+                    self._cur_const_mode = None
+                case 'Ext \u26A0':
+                    # EXTI and EXTV are really two different modes, but we treat them
+                    # as one for consistency. Unfortunately that means when the user
+                    # switches to "EXT" mode, you don't know whether they actually want
+                    # V or I, so we just assume V.
+                    self._cur_const_mode = 'Voltage'
+                    new_param_state[':EXT:MODE'] = 'EXTV'
+                case 'List':
+                    # This is not a parameter with a state - it's just a command to switch
+                    # modes. The normal :FUNCTION tells us we're in List mode, but it
+                    # doesn't allow us to SWITCH TO the List mode!
+                    self._write_mode_select(':LIST:STATE:ON')
+                    self._param_state[':FUNCTION:MODE'] = 'LIST'
+                    self._cur_const_mode = self._param_state[':LIST:MODE'].title()
+                case 'Program':
+                    # This is not a parameter with a state - it's just a command to switch
+                    # modes. The normal :FUNCTION tells us we're in List mode, but it
+                    # doesn't allow us to SWITCH TO the List mode!
+                    self._write_mode_select(':PROGRAM:STATE:ON')
+                    self._param_state[':FUNCTION:MODE'] = 'PROGRAM'
+                    self._cur_const_mode = None
+
+            # Changing the mode turns off the load and short.
+            # We have to do this manually in order for the later mode change to take
+            # effect. If you try to change mode while the load is on, the SDL turns off
+            # the load, but then ignores the mode change.
+            self._update_load_state(0)
+            self._update_short_state(0)
 
-        self._update_param_state_and_inst(new_param_state)
-        self._update_widgets()
+            self._update_param_state_and_inst(new_param_state)
+        self._schedule_update_widgets()
 
     def _on_click_dynamic_mode(self):
         """Handle clicking on a Dynamic Mode button."""
@@ -1932,16 +2200,17 @@ Connected to {self._inst.resource_name}
         # We have to do this manually in order for the later mode change to take effect.
         # If you try to change mode while the load is on, the SDL turns off the load,
         # but then ignores the mode change.
-        self._update_load_state(0)
-        self._update_short_state(0)
+        with self._inst.batched():
+            self._update_load_state(0)
+            self._update_short_state(0)
 
-        info = self._cur_mode_param_info()
-        mode_name = info['mode_name']
-        new_param_state = {':FUNCTION:TRANSIENT': self._cur_const_mode.upper(),
-                           f':{mode_name}:TRANSIENT:MODE': rb.wid.upper()}
+            info = self._cur_mode_param_info()
+            mode_name = info['mode_name']
+            new_param_state = {':FUNCTION:TRANSIENT': self._cur_const_mode.upper(),
+                               f':{mode_name}:TRANSIENT:MODE': rb.wid.upper()}
 
-        self._update_param_state_and_inst(new_param_state)
-        self._update_widgets()
+            self._update_param_state_and_inst(new_param_state)
+        self._schedule_update_widgets()
 
     def _on_click_const_mode(self):
         """Handle clicking on a Constant Mode button."""
@@ -1975,11 +2244,12 @@ Connected to {self._inst.resource_name}
         # We have to do this manually in order for the later mode change to take effect.
         # If you try to change mode while the load is on, the SDL turns off the load,
         # but then ignores the mode change.
-        self._update_load_state(0)
-        self._update_short_state(0)
+        with self._inst.batched():
+            self._update_load_state(0)
+            self._update_short_state(0)
 
-        self._update_param_state_and_inst(new_param_state)
-        self._update_widgets()
+            self._update_param_state_and_inst(new_param_state)
+        self._schedule_update_widgets()
 
     def _on_click_range(self):
         """Handle clicking on a V or I range button."""
@@ -1996,7 +2266,9 @@ Connected to {self._inst.resource_name}
             new_param_state = {f':{mode_name}{trans}:VRANGE': val.strip('V')}
         else:
             new_param_state = {f':{mode_name}{trans}:IRANGE': val.strip('A')}
-        self._update_param_state_and_inst(new_param_state)
+        if not self._update_param_state_and_inst(new_param_state):
+            # Nothing changed, so there's no need to update the widgets
+            return
         self._update_widgets()
 
     def _on_value_change(self):
@@ -2066,7 +2338,10 @@ Connected to {self._inst.resource_name}
             if orig_other_val != other_val:
                 scpi_cmd = f'{mode_name}:{other_scpi}'
                 new_param_state[scpi_cmd] = other_val
-        self._update_param_state_and_inst(new_param_state)
+        if not self._update_param_state_and_inst(new_param_state):
+            # Nothing changed (e.g. the same value was entered again), so there's no
+            # need to update the widgets
+            return
         if scpi_cmd == ':LIST:STEP':
             # When we change the number of steps, we might need to read in more
             # rows from the instrument
@@ -2324,20 +2599,7 @@ Connected to {self._inst.resource_name}
 
     def _scpi_cmds_from_param_info(self, param_info, param_spec):
         """Create a SCPI command from a param_info structure."""
-        mode_name = param_info['mode_name']
-        if mode_name is None: # General parameters
-            mode_name = ''
-        else:
-            mode_name = f':{mode_name}:'
-        if isinstance(param_spec[0], (tuple, list)):
-            ps1, ps2 = param_spec[0]
-            if ps1[0] == ':':
-                mode_name = ''
-            return f'{mode_name}{ps1}', f'{mode_name}{ps2}'
-        ps1 = param_spec[0]
-        if ps1[0] == ':':
-            mode_name = ''
-        return f'{mode_name}{ps1}', None
+        return _scpi_cmds_from_param_info(param_info, param_spec)
 
     def _put_inst_in_mode(self, overall_mode, const_mode):
         """Place the SDL in the given overall mode (and const mode)."""
@@ -2346,53 +2608,51 @@ Connected to {self._inst.resource_name}
             const_mode = const_mode.upper()
         match overall_mode:
             case 'DYNAMIC':
-                self._inst.write(f':FUNCTION:TRANSIENT {const_mode}')
+                self._write_mode_select(f':FUNCTION:TRANSIENT {const_mode}')
             case 'BASIC':
-                self._inst.write(f':FUNCTION {const_mode}')
+                self._write_mode_select(f':FUNCTION {const_mode}')
             case 'LED':
-                self._inst.write(':FUNCTION LED')
+                self._write_mode_select(':FUNCTION LED')
             case 'BATTERY':
-                self._inst.write(':FUNCTION BATTERY')
+                self._write_mode_select(':FUNCTION BATTERY')
                 self._inst.write(f':BATTERY:MODE {const_mode}')
             case 'OCPT':
-                self._inst.write(':OCP:FUNC')
+                self._write_mode_select(':OCP:FUNC')
             case 'OPPT':
-                self._inst.write(':OPP:FUNC')
+                self._write_mode_select(':OPP:FUNC')
             case 'EXT \u26A0':
                 if const_mode == 'VOLTAGE':
-                    self._inst.write(':EXT:MODE EXTV')
+                    self._write_mode_select(':EXT:MODE EXTV')
                 else:
                     assert const_mode == 'CURRENT'
-                    self._inst.write(':EXT:MODE EXTI')
+                    self._write_mode_select(':EXT:MODE EXTI')
             case 'LIST':
-                self._inst.write(':LIST:STATE:ON')
+                self._write_mode_select(':LIST:STATE:ON')
             case 'PROGRAM':
-                self._inst.write(':PROGRAM:STATE:ON')
+                self._write_mode_select(':PROGRAM:STATE:ON')
             case _:
                 assert False, overall_mode
 
+    def _write_mode_select(self, cmd):
+        """Send a command that switches the SDL's mode.
+
+        Any batched commands, including this one, are sent right away so that the
+        SDL has changed modes before it sees anything that follows."""
+        self._inst.write(cmd)
+        self._inst.flush()
+
     def _update_state_from_param_state(self):
         """Update all internal state and widgets based on the current _param_state."""
         if self._param_state[':EXT:MODE'] != 'INT':
             mode = 'Ext \u26A0'
+        elif (self._param_state[':FUNCTION:MODE'] == 'BASIC' and
+              self._param_state[':FUNCTION'] == 'LED'):
+            # LED is considered a BASIC mode by the SDL
+            mode = 'LED'
         else:
-            mode = self._param_state[':FUNCTION:MODE']
-            # Convert the title-case SDL-specific name to the name we use in the GUI
-            match mode:
-                case 'BASIC':
-                    if self._param_state[':FUNCTION'] == 'LED':
-                        mode = 'LED'
-                case 'TRAN':
-                    mode = 'Dynamic'
-                case 'OCP':
-                    mode = 'OCPT'
-                case 'OPP':
-                    mode = 'OPPT'
-                # Other cases are already correct
-            if mode not in ('LED', 'OCPT', 'OPPT'):
-                mode = mode.title()
-        assert mode in ('Basic', 'LED', 'Battery', 'OCPT', 'OPPT', 'Ext \u26A0',
-                        'Dynamic', 'Program', 'List')
+            # Convert the SDL-specific name to the name we use in the GUI
+            mode = _SDL_FUNCTION_MODE_TO_OVERALL_MODE[
+                self._param_state[':FUNCTION:MODE']]
         self._cur_overall_mode = mode
 
         # Initialize the dynamic and const mode as appropriate
@@ -2457,10 +2717,14 @@ Connected to {self._inst.resource_name}
             self._list_mode_widths = []
             self._list_mode_slews = []
         steps = self._param_state[':LIST:STEP']
+        queries = []
         for i in range(len(self._list_mode_levels)+1, steps+1):
-            self._list_mode_levels.append(float(self._inst.query(f':LIST:LEVEL? {i}')))
-            self._list_mode_widths.append(float(self._inst.query(f':LIST:WIDTH? {i}')))
-            self._list_mode_slews.append(float(self._inst.query(f':LIST:SLEW? {i}')))
+            queries.extend((f':LIST:LEVEL? {i}', f':LIST:WIDTH? {i}',
+                            f':LIST:SLEW? {i}'))
+        vals = [float(x) for x in self._inst.query_multiple(queries)]
+        self._list_mode_levels.extend(vals[0::3])
+        self._list_mode_widths.extend(vals[1::3])
+        self._list_mode_slews.extend(vals[2::3])
 
     def _update_load_state(self, state, update_inst=True, update_widgets=True):
         """Update the load on/off internal state, possibly updating the instrument."""
@@ -2495,8 +2759,7 @@ Connected to {self._inst.resource_name}
             # complete (or aborted), the ADDCAP field is not automatically updated
             # like it is when you run a test from the front panel. So we do the
             # computation and update it here.
-            disch_cap = self._inst.measure_battery_capacity()
-            add_cap = self._inst.measure_battery_add_capacity()
+            _, disch_cap, add_cap = self._inst.measure_battery()
             new_add_cap = (disch_cap + add_cap) * 1000  # ADDCAP takes mAh
             self._inst.write(f':BATTERY:ADDCAP {new_add_cap}')
             # Update the battery log entries
@@ -2550,37 +2813,64 @@ Connected to {self._inst.resource_name}
         self._update_param_state_and_inst(new_param_state)
         self._update_short_onoff_button(state)
 
-    def _show_or_disable_widgets(self, widget_list):
-        """Show/enable or hide/disable widgets based on regular expressions."""
-        for widget_re in widget_list:
-            if widget_re[0] == '~':
-                # Hide unused widgets
-                widget_re = widget_re[1:]
-                for trial_widget in self._widget_registry:
-                    if re.fullmatch(widget_re, trial_widget):
-                        self._widget_registry[trial_widget].hide()
-            elif widget_re[0] == '!':
-                # Disable (and grey out) unused widgets
-                widget_re = widget_re[1:]
-                for trial_widget in self._widget_registry:
-                    if re.fullmatch(widget_re, trial_widget):
-                        widget = self._widget_registry[trial_widget]
+    def _show_or_disable_widgets(self, widget_actions):
+        """Show/enable or hide/disable widgets based on compiled widget actions."""
+        for action, widget_re in widget_actions:
+            for trial_widget, widget in self._widgets_matching(widget_re):
+                match action:
+                    case 'hide':
+                        # Hide unused widgets
+                        widget.hide()
+                    case 'disable':
+                        # Disable (and grey out) unused widgets
                         widget.setEnabled(False)
                         if isinstance(widget, QRadioButton):
-                            # For disabled radio buttons we remove ALL selections so it
-                            # doesn't look confusing
+                            # For disabled radio buttons we remove ALL selections so
+                            # it doesn't look confusing
                             widget.button_group.setExclusive(False)
                             widget.setChecked(False)
                             widget.button_group.setExclusive(True)
+                    case 'show':
+                        # Enable/show everything else
+                        widget.setEnabled(True)
+                        widget.show()
+
+    def _widgets_matching(self, widget_re):
+        """Return the (name, widget) pairs whose names fully match a compiled RE.
+
+        The registry doesn't change once _init_widgets is done, so the matches for
+        each RE are found once and cached."""
+        matches = self._widget_re_matches.get(widget_re)
+        if matches is None:
+            name = widget_re.pattern
+            if re.escape(name) == name:
+                # A plain widget name, so just look it up
+                widget = self._widget_registry.get(name)
+                matches = () if widget is None else ((name, widget),)
             else:
-                # Enable/show everything else
-                for trial_widget in self._widget_registry:
-                    if re.fullmatch(widget_re, trial_widget):
-                        self._widget_registry[trial_widget].setEnabled(True)
-                        self._widget_registry[trial_widget].show()
+                matches = tuple((name, widget)
+                                for name, widget in self._widget_registry.items()
+                                if widget_re.fullmatch(name))
+            self._widget_re_matches[widget_re] = matches
+        return matches
+
+    def _schedule_update_widgets(self):
+        """Update the widgets on the next pass through the event loop.
+
+        Mode changes that arrive together then cost a single widget update."""
+        if not self._update_widgets_pending:
+            self._update_widgets_pending = True
+            QTimer.singleShot(0, self._flush_update_widgets)
+
+    def _flush_update_widgets(self):
+        """Perform a scheduled widget update if it hasn't already happened."""
+        if self._update_widgets_pending:
+            self._update_widgets()
 
     def _update_widgets(self, minmax_ok=True):
         """Update all parameter widgets with the current _param_state values."""
+        # Any scheduled update is covered by this one
+        self._update_widgets_pending = False
         if self._cur_overall_mode is None:
             return
 
@@ -2594,109 +2884,82 @@ Connected to {self._inst.resource_name}
 
         # We start by setting the proper radio button selections for the "Overall Mode"
         # and the "Constant Mode" groups
-        for widget_name, widget in self._widget_registry.items():
-            if widget_name.startswith('Overall_'):
-                widget.setChecked(widget_name.endswith(self._cur_overall_mode))
-            if self._cur_const_mode is not None and widget_name.startswith('Const_'):
-                widget.setChecked(widget_name.endswith(self._cur_const_mode))
-
-        # First we go through the widgets for the Dynamic sub-modes and the Constant
-        # Modes and enable or disable them as appropriate based on the Overall Mode.
-        self._show_or_disable_widgets(_SDL_OVERALL_MODES[self._cur_overall_mode])
-
-        # Now we enable or disable widgets by first scanning through the "General"
-        # widget list and then the widget list specific to this overall mode (if any).
-        self._show_or_disable_widgets(_SDL_MODE_PARAMS['General']['widgets'])
-        if param_info['widgets'] is not None:
-            self._show_or_disable_widgets(param_info['widgets'])
+        for mode, rb in self._overall_mode_rbs.items():
+            rb.setChecked(mode == self._cur_overall_mode)
+        if self._cur_const_mode is not None:
+            for mode, rb in self._const_mode_rbs.items():
+                rb.setChecked(mode == self._cur_const_mode)
+
+        # Now we go through the widgets for the Dynamic sub-modes and the Constant
+        # Modes and enable or disable them as appropriate based on the Overall Mode,
+        # and then do the same for the "General" widget list and the widget list
+        # specific to this overall mode (if any). These are all combined into a
+        # single list ahead of time.
+        self._show_or_disable_widgets(param_info['all_widget_actions'])
 
         # Now we go through the details for each parameter and fill in the widget
         # value and set the widget parameters, as appropriate. We do the General
         # parameters first and then the parameters for the current mode.
         new_param_state = {}
+        widget_registry = self._widget_registry
         for phase in range(2):
             if phase == 0:
-                params = _SDL_MODE_PARAMS['General']['params']
+                info = _SDL_MODE_PARAMS['General']
                 mode_name = None
             else:
-                params = param_info['params']
+                info = param_info
                 mode_name = param_info['mode_name']
-            for scpi_cmd, param_full_type, *rest in params:
-                if isinstance(scpi_cmd, (tuple, list)):
-                    # Ignore the boolean flag
-                    scpi_cmd = scpi_cmd[0]
-                param_type = param_full_type[-1]
-
-                # Parse out the label and main widget REs and the min/max values
-                match len(rest):
-                    case 1:
-                        # For General, these parameters don't have associated widgets
-                        assert rest[0] in (False, True)
-                        widget_label = None
-                        widget_main = None
-                    case 2:
-                        # Just a label and main widget, no value range
-                        widget_label, widget_main = rest
-                    case 4:
-                        # A label and main widget with min/max value
-                        widget_label, widget_main, min_val, max_val = rest
-                        trans = self._transient_string()
-                        if min_val in ('C', 'V', 'P'):
-                            min_val = 0
-                        elif min_val == 'S':
-                            min_val = 0.001
-                        elif isinstance(min_val, str) and min_val.startswith('W:'):
+            for (full_scpi_cmd, param_type, dec, widget_label, widget_main,
+                 min_val, max_val) in info['widget_params']:
+                # Resolve the min/max values that depend on the current state
+                if isinstance(min_val, str): # W:
+                    if minmax_ok:
+                        # This is needed because when we're first loading up the
+                        # widgets from a cold start, the paired widget may not
+                        # have a good min value yet
+                        min_val = widget_registry[min_val[2:]].value()
+                    else:
+                        min_val = 0
+                if isinstance(max_val, str):
+                    trans = self._transient_string()
+                    match max_val[0]:
+                        case 'C': # Based on current range selection (5A, 30A)
+                            # Don't need to check for mode_name being None
+                            # because that will never happen for C/V/P/S
+                            max_val = self._param_state[
+                                f':{mode_name}{trans}:IRANGE']
+                            max_val = float(max_val)
+                        case 'V': # Based on voltage range selection (36V, 150V)
+                            max_val = self._param_state[
+                                f':{mode_name}{trans}:VRANGE']
+                            max_val = float(max_val)
+                        case 'P': # SDL1020 is 200W, SDL1030 is 300W
+                            max_val = self._inst._max_power
+                        case 'S': # Slew range depends on IRANGE
+                            if self._param_state[
+                                    f':{mode_name}{trans}:IRANGE'] == '5':
+                                max_val = 0.5
+                            else:
+                                max_val = 2.5
+                        case 'W':
                             if minmax_ok:
-                                # This is needed because when we're first loading up the
-                                # widgets from a cold start, the paired widget may not
-                                # have a good min value yet
-                                min_val = self._widget_registry[min_val[2:]].value()
+                                # This is needed because when we're first loading
+                                # up the widgets from a cold start, the paired
+                                # widget may not have a good max value yet
+                                max_val = (widget_registry[max_val[2:]]
+                                           .value())
                             else:
-                                min_val = 0
-                        if isinstance(max_val, str):
-                            match max_val[0]:
-                                case 'C': # Based on current range selection (5A, 30A)
-                                    # Don't need to check for mode_name being None
-                                    # because that will never happen for C/V/P/S
-                                    max_val = self._param_state[
-                                        f':{mode_name}{trans}:IRANGE']
-                                    max_val = float(max_val)
-                                case 'V': # Based on voltage range selection (36V, 150V)
-                                    max_val = self._param_state[
-                                        f':{mode_name}{trans}:VRANGE']
-                                    max_val = float(max_val)
-                                case 'P': # SDL1020 is 200W, SDL1030 is 300W
-                                    max_val = self._inst._max_power
-                                case 'S': # Slew range depends on IRANGE
-                                    if self._param_state[
-                                            f':{mode_name}{trans}:IRANGE'] == '5':
-                                        max_val = 0.5
-                                    else:
-                                        max_val = 2.5
-                                case 'W':
-                                    if minmax_ok:
-                                        # This is needed because when we're first loading
-                                        # up the widgets from a cold start, the paired
-                                        # widget may not have a good max value yet
-                                        max_val = (self._widget_registry[max_val[2:]]
-                                                   .value())
-                                    else:
-                                        max_val = 1000000000
-                    case _:
-                        assert False, f'Unknown widget parameters {rest}'
+                                max_val = 1000000000
 
                 if widget_label is not None:
-                    self._widget_registry[widget_label].show()
-                    self._widget_registry[widget_label].setEnabled(True)
+                    widget_registry[widget_label].show()
+                    widget_registry[widget_label].setEnabled(True)
 
                 if widget_main is not None:
-                    full_scpi_cmd = scpi_cmd
-                    if mode_name is not None and scpi_cmd[0] != ':':
-                        full_scpi_cmd = f':{mode_name}:{scpi_cmd}'
                     val = self._param_state[full_scpi_cmd]
 
                     if param_type in ('d', 'f', 'b'):
-                        widget = self._widget_registry[widget_main]
+                        widget = widget_registry[widget_main]
                         widget.setEnabled(True)
                         widget.show()
                     if param_type in ('d', 'f'):
@@ -2716,8 +2979,6 @@ Connected to {self._inst.resource_name}
                                 widget_val = float(widget.value())
                                 new_param_state[full_scpi_cmd] = widget_val
                         case 'f': # Floating point
-                            assert param_full_type[0] == '.'
-                            dec = int(param_full_type[1:-1])
                             dec10 = 10 ** dec
                             widget.setDecimals(dec)
                             widget.setValue(val)
@@ -2730,13 +2991,12 @@ Connected to {self._inst.resource_name}
                                 new_param_state[full_scpi_cmd] = widget_val
                         case 'r': # Radio button
                             # In this case only the widget_main is an RE
-                            for trial_widget in self._widget_registry:
-                                if re.fullmatch(widget_main, trial_widget):
-                                    widget = self._widget_registry[trial_widget]
-                                    widget.setEnabled(True)
-                                    checked = (trial_widget.upper()
-                                               .endswith('_'+str(val).upper()))
-                                    widget.setChecked(checked)
+                            for trial_widget, widget in self._widgets_matching(
+                                    _SDL_RADIO_RES[widget_main]):
+                                widget.setEnabled(True)
+                                checked = (trial_widget.upper()
+                                           .endswith('_'+str(val).upper()))
+                                widget.setChecked(checked)
                         case _:
                             assert False, f'Unknown param type {param_type}'
 
@@ -2956,17 +3216,22 @@ Reset Addl Cap & Test Log to start fresh."""
         return _SDL_MODE_PARAMS[key]
 
     def _update_param_state_and_inst(self, new_param_state):
-        """Update the internal state and instrument based on partial param_state."""
+        """Update the internal state and instrument based on partial param_state.
+
+        Returns True if any parameter actually changed."""
+        changed = False
         for key, data in new_param_state.items():
             if data != self._param_state[key]:
                 self._update_one_param_on_inst(key, data)
                 self._param_state[key] = data
+                changed = True
+        return changed
 
     def _update_one_param_on_inst(self, key, data):
         """Update the value for a single parameter on the instrument."""
         fmt_data = data
         if isinstance(data, bool):
-            fmt_data = '1' if True else '0'
+            fmt_data = '1' if data else '0'
         elif isinstance(data, float):
             fmt_data = '%.6f' % data
         elif isinstance(data, int):
@@ -2978,7 +3243,10 @@ Reset Addl Cap & Test Log to start fresh."""
             fmt_data = data.upper()
         else:
             assert False
-        self._inst.write(f'{key} {fmt_data}')
+        if key in _SDL_MODE_SELECT_PARAMS:
+            self._write_mode_select(f'{key} {fmt_data}')
+        else:
+            self._inst.write(f'{key} {fmt_data}')
 
     def _reset_batt_log(self):
         """Reset the battery log."""
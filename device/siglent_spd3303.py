@@ -88,18 +88,15 @@ class InstrumentSiglentSPD3303(Device4882):
 
     def connect(self, *args, **kwargs):
         super().connect(*args, **kwargs)
-        idn = self.idn().split(',')
-        if len(idn) != 4:
-            assert ValueError
-        (self._manufacturer,
-         self._model,
-         self._serial_number,
-         self._firmware_version,
-         self._hardware_version) = idn
-        if self._manufacturer != 'Siglent Technologies':
-            assert ValueError
-        if not self._model.startswith('SPD'):
-            assert ValueError
+        # The identity fields were filled in from the *IDN? response by connect()
+        if (len(self._idn.split(',')) != 5 or
+                self._manufacturer != 'Siglent Technologies' or
+                not self._model.startswith('SPD')):
+            idn = self._idn
+            self.disconnect()
+            raise ValueError(f'Not a Siglent SPD3303 power supply: manufacturer '
+                             f'"{self._manufacturer}", model "{self._model}" '
+                             f'(IDN "{idn}")')
         self._long_name = f'{self._model} @ {self._resource_name}'
 
     def disconnect(self, *args, **kwargs):
@@ -25,9 +25,11 @@ import sys
 
 from PyQt6.QtWidgets import QApplication
 
+from device.config_widget_base import APP_STYLE_SHEET
 from main_window import MainWindow
 
 app = QApplication(sys.argv)  # sys.argv is modified to remove Qt options
+app.setStyleSheet(APP_STYLE_SHEET)
 main_window = MainWindow(app, sys.argv)
 main_window.show()
 
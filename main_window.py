@@ -57,6 +57,11 @@ from plot_histogram_window import PlotHistogramWindow
 from plot_xy_window import PlotXYWindow
 
 
+# Number of data points to allocate for in the measurement arrays when they are
+# first created. The arrays double in size every time they fill up.
+_INITIAL_MEASUREMENT_CAPACITY = 1024
+
+
 class IPAddressDialog(QDialog):
     """Custom dialog that accepts and validates an IP address."""
     def __init__(self, parent=None):
@@ -131,7 +136,11 @@ class MainWindow(QWidget):
         #           config widget class instance)
         self._open_resources = []
 
-        self._measurement_times = []
+        # The measurement times and the measurement and trigger values are stored in
+        # pre-allocated numpy arrays that all share the same capacity. Only the first
+        # _measurement_count entries of each array are valid.
+        self._measurement_count = 0
+        self._measurement_times = np.empty(_INITIAL_MEASUREMENT_CAPACITY)
         self._measurements = {}
         self._measurement_units = {}
         self._measurement_formats = {}
@@ -177,7 +186,7 @@ class MainWindow(QWidget):
         ### Create the menu bar
 
         self._menubar = QMenuBar()
-        self._menubar.setStyleSheet('margin: 0px; padding: 0px;')
+        self._menubar.setObjectName('InstMenuBar')
 
         self._menubar_device = self._menubar.addMenu('&Device')
         action = QAction('&Open IP address...', self)
@@ -400,18 +409,19 @@ class MainWindow(QWidget):
 
     def _on_erase_all(self):
         """Handle Erase All button."""
-        self._measurement_times = []
+        self._measurement_count = 0
+        self._measurement_times = np.empty(_INITIAL_MEASUREMENT_CAPACITY)
         for key in self._measurements:
-            self._measurements[key] = []
+            self._measurements[key] = np.full(_INITIAL_MEASUREMENT_CAPACITY, math.nan)
         self._measurement_last_good = True
         for key in self._triggers:
-            self._triggers[key] = []
+            self._triggers[key] = np.full(_INITIAL_MEASUREMENT_CAPACITY, math.nan)
         for measurement_display_widget in self._measurement_display_widgets:
             measurement_display_widget.update()
 
     def _on_click_save_csv(self):
         """Handle Save CSV button."""
-        if len(self._measurement_times) == 0:
+        if self._measurement_count == 0:
             return
         fn = QFileDialog.getSaveFileName(self, caption='Save Measurements as CSV',
                                          filter='All (*.*);;CSV (*.csv)',
@@ -423,8 +433,9 @@ class MainWindow(QWidget):
             csvw = csv.writer(fp, )
             header = ['Elapsed Time (s)', 'Absolute Time']
             meas_used_keys = []
+            npts = self._measurement_count
             for key in self._measurements:
-                if np.all(np.isnan(self._measurements[key])):
+                if np.all(np.isnan(self._measurements[key][:npts])):
                     continue
                 meas_used_keys.append(key)
                 m_name = self._measurement_names[key]
@@ -435,29 +446,23 @@ class MainWindow(QWidget):
                 header.append(label)
             trig_used_keys = []
             for key in self._triggers:
-                if np.all(np.isnan(self._triggers[key])):
+                if np.all(np.isnan(self._triggers[key][:npts])):
                     continue
                 trig_used_keys.append(key)
                 header.append(self._trigger_names[key])
             csvw.writerow(header)
-            for idx, time_ in enumerate(self._measurement_times):
-                row = [time_ - self._measurement_times[0]]
-                timestr = time.strftime('%Y/%m/%d %H:%M:%S',
-                                        time.localtime(time_))
-                row.append(timestr)
-                for key in meas_used_keys:
-                    meas = self._measurements[key][idx]
-                    if np.isnan(meas):
-                        row.append('')
-                    else:
-                        row.append(meas)
-                for key in trig_used_keys:
-                    trig = self._triggers[key][idx]
-                    if np.isnan(trig):
-                        row.append('')
-                    else:
-                        row.append(trig)
-                csvw.writerow(row)
+            # Build each column in one pass and then write all of the rows at once
+            times = self._measurement_times[:npts]
+            columns = [(times - times[0]).tolist(),
+                       [time.strftime('%Y/%m/%d %H:%M:%S', time.localtime(time_))
+                        for time_ in times.tolist()]]
+            for key in meas_used_keys:
+                columns.append(['' if math.isnan(meas) else meas
+                                for meas in self._measurements[key][:npts].tolist()])
+            for key in trig_used_keys:
+                columns.append(['' if math.isnan(trig) else bool(trig)
+                                for trig in self._triggers[key][:npts].tolist()])
+            csvw.writerows(zip(*columns))
 
     def _on_click_acquisition_mode(self):
         """Handle Measurement Mode radio buttons."""
@@ -591,7 +596,7 @@ Copyright 2022, Robert S. French"""
         self._refresh_menubar_device_recent_resources()
 
         # Update the measurement list with newly available measurements
-        num_existing = len(self._measurement_times)
+        capacity = self._measurement_times.shape[0]
         measurements, triggers = config_widget.update_measurements_and_triggers(
                                                                         read_inst=False)
         for meas_key, meas in measurements.items():
@@ -601,7 +606,7 @@ Copyright 2022, Robert S. French"""
                 # We skip creation of new measurements if the key is already there.
                 # This happens if the instrument exists before, was deleted, and then
                 # is opened again.
-                self._measurements[key] = [math.nan] * num_existing
+                self._measurements[key] = np.full(capacity, math.nan)
                 self._measurement_units[key] = meas['unit']
                 self._measurement_formats[key] = meas['format']
                 self._measurement_names[key] = f'{inst.name}: {name}'
@@ -612,7 +617,7 @@ Copyright 2022, Robert S. French"""
                 # We skip creation of new triggers if the key is already there.
                 # This happens if the instrument exists before, was deleted, and then
                 # is opened again.
-                self._triggers[key] = [math.nan] * num_existing
+                self._triggers[key] = np.full(capacity, math.nan)
                 self._trigger_names[key] = f'{inst.name}: {name}'
         for measurement_display_widget in self._measurement_display_widgets:
             measurement_display_widget.measurements_changed()
@@ -643,18 +648,18 @@ Copyright 2022, Robert S. French"""
 
     def _heartbeat_update(self):
         """Regular updates like the elapsed time."""
-        if len(self._measurement_times) == 0:
+        npts = self._measurement_count
+        if npts == 0:
             msg1 = 'Started: N/A'
             msg2 = 'Elapsed: N/A'
         else:
             msg1 = ('Started: ' +
                     time.strftime('%Y %b %d %H:%M:%S',
                                   time.localtime(self._measurement_times[0])))
-            msg2 = 'Elapsed: ' + self._time_to_hms(self._measurement_times[-1] -
+            msg2 = 'Elapsed: ' + self._time_to_hms(self._measurement_times[npts-1] -
                                                    self._measurement_times[0])
         self._widget_measurement_started.setText(msg1)
         self._widget_measurement_elapsed.setText(msg2)
-        npts = len(self._measurement_times)
         self._widget_measurement_points.setText(f'# Data Points: {npts}')
         self._widget_measurement_spent.setText(
             f'Last Measurement Duration: {self._last_measurement_duration:.3f} s')
@@ -717,12 +722,14 @@ Copyright 2022, Robert S. French"""
         # time so we can match up measurements in X/Y plots and file saving.
         if len(self._open_resources) == 0:
             return
-        start_time = time.time()
+        # The duration uses the monotonic clock so it can't be thrown off by changes
+        # to the wall clock
+        start_time = time.monotonic()
         # First update all the cached measurements and config widget displays
         for resource_name, inst, config_widget in self._open_resources:
             if config_widget is not None:
                 config_widget.update_measurements_and_triggers()
-        end_time = time.time()
+        end_time = time.monotonic()
         self._last_measurement_duration = end_time - start_time
         # Check for the current trigger condition
         self._check_acquisition_ready()
@@ -736,72 +743,69 @@ Copyright 2022, Robert S. French"""
             else:
                 return
         cur_time = time.time()
-        self._measurement_times.append(cur_time)
-        # Now go through and read all the cached measurements
-        meas_updated_keys = []
-        trig_updated_keys = []
+        if self._measurement_count == self._measurement_times.shape[0]:
+            self._grow_measurement_arrays()
+        idx = self._measurement_count
+        capacity = self._measurement_times.shape[0]
+        self._measurement_times[idx] = cur_time
+        self._measurement_count += 1
+        # Now go through and read all the cached measurements. Every array slot past
+        # the current count is already NaN, so measurements and triggers for
+        # instruments that have been closed don't need to be filled in.
+        all_measurements = self._measurements
+        all_triggers = self._triggers
+        measurement_names = self._measurement_names
+        trigger_names = self._trigger_names
         for resource_name, inst, config_widget in self._open_resources:
             if config_widget is not None:
+                long_name = inst.long_name
                 measurements = config_widget.get_measurements()
                 for meas_key, meas in measurements.items():
                     name = meas['name']
-                    key = (inst.long_name, meas_key)
-                    meas_updated_keys.append(key)
-                    if key not in self._measurements:
-                        self._measurements[key] = ([math.nan] *
-                                                   len(self._measurement_times))
+                    key = (long_name, meas_key)
+                    vals = all_measurements.get(key)
+                    if vals is None:
+                        vals = np.full(capacity, math.nan)
+                        all_measurements[key] = vals
                         self._measurement_units[key] = meas['unit']
                         self._measurement_formats[key] = meas['format']
-                        self._measurement_names[key] = f'{inst.name}: {name}'
-                    if force_nan:
-                        val = math.nan
-                    else:
+                    if not force_nan:
                         val = meas['val']
-                        if val is None:
-                            val = math.nan
-                    self._measurements[key].append(val)
+                        if val is not None:
+                            vals[idx] = val
                     # The user can change the short name
-                    self._measurement_names[key] = f'{inst.name}: {name}'
+                    measurement_names[key] = f'{inst.name}: {name}'
                 triggers = config_widget.get_triggers()
                 for trig_key, trig in triggers.items():
                     name = trig['name']
-                    key = (inst.long_name, trig_key)
-                    trig_updated_keys.append(key)
-                    if key not in self._triggers:
-                        self._triggers[key] = ([math.nan] *
-                                               len(self._measurement_times))
-                        self._trigger_names[key] = f'{inst.name}: {name}'
-                    if force_nan:
-                        val = math.nan
-                    else:
+                    key = (long_name, trig_key)
+                    vals = all_triggers.get(key)
+                    if vals is None:
+                        vals = np.full(capacity, math.nan)
+                        all_triggers[key] = vals
+                    if not force_nan:
                         val = trig['val']
-                        if val is None:
-                            val = math.nan
-                    self._triggers[key].append(val)
+                        if val is not None:
+                            vals[idx] = val
                     # The user can change the short name
-                    self._trigger_names[key] = f'{inst.name}: {name}'
-        if len(meas_updated_keys) > 0:
-            # As long as we updated at least one real instrument, then go through
-            # the measurement list and see which instruments we didn't update. This
-            # happens because those instruments were closed and no longer exist. But
-            # to keep everything happy all measurements need to be the same length,
-            # so we add on NaNs.
-            for key in self._measurements:
-                if key not in meas_updated_keys:
-                    self._measurements[key].append(math.nan)
-        if len(trig_updated_keys) > 0:
-            # As long as we updated at least one real instrument, then go through
-            # the trigger list and see which instruments we didn't update. This
-            # happens because those instruments were closed and no longer exist. But
-            # to keep everything happy all triggers need to be the same length,
-            # so we add on NaNs.
-            for key in self._triggers:
-                if key not in trig_updated_keys:
-                    self._triggers[key].append(math.nan)
+                    trigger_names[key] = f'{inst.name}: {name}'
         self._measurement_last_good = not force_nan
         for measurement_display_widget in self._measurement_display_widgets:
             measurement_display_widget.update()
 
+    def _grow_measurement_arrays(self):
+        """Double the capacity of the measurement time, value, and trigger arrays."""
+        npts = self._measurement_count
+        capacity = self._measurement_times.shape[0] * 2
+        new_times = np.empty(capacity)
+        new_times[:npts] = self._measurement_times[:npts]
+        self._measurement_times = new_times
+        for arrays in (self._measurements, self._triggers):
+            for key, old_vals in arrays.items():
+                new_vals = np.full(capacity, math.nan)
+                new_vals[:npts] = old_vals[:npts]
+                arrays[key] = new_vals
+
     def _update_widgets(self):
         """Update our widgets with current information."""
         state_combo = self._widget_registry['InstrumentStateCombo']
@@ -25,7 +25,6 @@ from PyQt6.QtWidgets import (QCheckBox,
                              QColorDialog,
                              QComboBox,
                              QGridLayout,
-                             QGroupBox,
                              QHBoxLayout,
                              QLabel,
                              QMenuBar,
@@ -403,8 +402,8 @@ class PlotHistogramWindow(QWidget):
 
     def update(self):
         """Update the plot using the current measurements."""
-        if (len(self._main_window._measurement_times) == 0 or
-            self._plot_data_source is None):
+        npts = self._main_window._measurement_count
+        if npts == 0 or self._plot_data_source is None:
             self._plot_item.setData([], [])
             self._widget_last_data.hide()
             self._widget_min_data.hide()
@@ -423,14 +422,17 @@ class PlotHistogramWindow(QWidget):
         self._widget_stddev_data.show()
         self._widget_num_data.show()
 
-        start_time = self._main_window._measurement_times[0]
-        stop_time = self._main_window._measurement_times[-1]
+        times = self._main_window._measurement_times[:npts]
+        start_time = times[0]
+        stop_time = times[-1]
 
         # Update X axis range
         x_min = start_time
         x_max = stop_time
-        times = np.array(self._main_window._measurement_times)
 
+        # The times are wall-clock times and can jump backwards if the system
+        # clock is adjusted, so select the points inside the plot duration with a
+        # mask rather than assuming they are sorted
         mask = None
         if self._plot_duration > 0:
             if x_max - x_min < self._plot_duration:
@@ -440,11 +442,7 @@ class PlotHistogramWindow(QWidget):
                 x_min = x_max - self._plot_duration
                 mask = times >= x_min
 
-        if mask is None:
-            times_mask = times
-        else:
-            times_mask = times[mask]
-        vals = np.array(self._main_window._measurements[self._plot_data_source])
+        vals = self._main_window._measurements[self._plot_data_source][:npts]
         if mask is not None:
             vals = vals[mask]
         finite_vals = vals[~np.isnan(vals)]
@@ -424,8 +424,9 @@ class PlotXYWindow(QWidget):
     def _on_click_all_measurements(self):
         """Handle Show All button."""
         source_num = 0
+        npts = self._main_window._measurement_count
         for key in self._main_window._measurements:
-            if np.all(np.isnan(self._main_window._measurements[key])):
+            if np.all(np.isnan(self._main_window._measurements[key][:npts])):
                 continue
             self._plot_y_sources[source_num] = key
             source_num += 1
@@ -565,20 +566,24 @@ class PlotXYWindow(QWidget):
 
     def update(self):
         """Update the plot using the current measurements."""
-        if len(self._main_window._measurement_times) == 0:
+        npts = self._main_window._measurement_count
+        if npts == 0:
             for plot_item in self._plot_items:
                 plot_item.setData([], [])
             return
 
-        start_time = self._main_window._measurement_times[0]
-        stop_time = self._main_window._measurement_times[-1]
+        times = self._main_window._measurement_times[:npts]
+        start_time = times[0]
+        stop_time = times[-1]
 
         # Update X axis range
         x_min = start_time
         x_max = stop_time
         x_scale = 1
-        times = np.array(self._main_window._measurement_times)
 
+        # The times are wall-clock times and can jump backwards if the system
+        # clock is adjusted, so select the points inside the plot duration with a
+        # mask rather than assuming they are sorted
         mask = None
         if self._plot_duration > 0:
             if x_max - x_min < self._plot_duration:
@@ -625,7 +630,7 @@ class PlotXYWindow(QWidget):
             case _:
                 x_scale = None
                 scatter = True
-                x_vals = np.array(self._main_window._measurements[self._plot_x_source])
+                x_vals = self._main_window._measurements[self._plot_x_source][:npts]
                 if mask is not None:
                     x_vals = x_vals[mask]
                 finite_x_vals = x_vals[~np.isnan(x_vals)]
@@ -649,7 +654,7 @@ class PlotXYWindow(QWidget):
             if plot_key is None:
                 plot_item.setData([], [])
                 continue
-            y_vals = np.array(self._main_window._measurements[plot_key])
+            y_vals = self._main_window._measurements[plot_key][:npts]
             if mask is not None:
                 y_vals = y_vals[mask]
             if scatter:
@@ -0,0 +1,86 @@
+################################################################################
+# tests/test_siglent_connect.py
+#
+# This file is part of the inst_conductor software suite.
+#
+# It contains tests of the identity checks done when connecting to an instrument.
+#
+# Copyright 2022 Robert S. French (rfrench@rfrench.org)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+import pytest
+
+from device.siglent_sdl1000 import InstrumentSiglentSDL1000
+from device.siglent_spd3303 import InstrumentSiglentSPD3303
+
+
+_SDL_IDN = 'Siglent Technologies,SDL1020X-E,SDL13GCX5R0123,1.1.1.21'
+_SPD_IDN = 'Siglent Technologies,SPD3303X,SPD3XIDX6R0123,1.01.01.02.05,V3.0'
+
+
+class FakeResource(object):
+    """A VISA resource that records what is sent to it."""
+    def __init__(self):
+        self.timeout = 1000
+        self.writes = []
+        self.closed = False
+
+    def query(self, s):
+        raise AssertionError(f'Unexpected query "{s}"')
+
+    def write(self, s):
+        self.writes.append(s)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize('cls, idn', [
+    (InstrumentSiglentSDL1000, _SPD_IDN),
+    (InstrumentSiglentSDL1000, 'Rigol Technologies,DL3021,DL3A1234,00.01.02'),
+    (InstrumentSiglentSDL1000, 'Siglent Technologies,SDL1020X-E'),
+    (InstrumentSiglentSPD3303, _SDL_IDN),
+    (InstrumentSiglentSPD3303, 'Rigol Technologies,DP832,DP8C1234,00.01.14,V1'),
+    (InstrumentSiglentSPD3303, 'Siglent Technologies,SPD3303X,SPD3XIDX6R0123'),
+])
+def test_connect_rejects_other_instruments(cls, idn):
+    res = FakeResource()
+    inst = cls(None, 'TCPIP::192.168.0.1', existing_names=[])
+    with pytest.raises(ValueError) as excinfo:
+        inst.connect(resource=res, idn=idn)
+    # The message names what was actually found
+    fields = idn.split(',')
+    assert fields[0] in str(excinfo.value)
+    assert fields[1] in str(excinfo.value)
+    # The rejected instrument is disconnected and nothing was sent to it
+    assert res.closed
+    assert res.writes == []
+    assert inst._resource is None
+    assert not inst._connected
+
+
+@pytest.mark.parametrize('cls, idn, writes', [
+    (InstrumentSiglentSDL1000, _SDL_IDN, [':SYST:REMOTE:STATE 1']),
+    (InstrumentSiglentSPD3303, _SPD_IDN, []),
+])
+def test_connect_accepts_supported_instruments(cls, idn, writes):
+    res = FakeResource()
+    inst = cls(None, 'TCPIP::192.168.0.1', existing_names=[])
+    inst.connect(resource=res, idn=idn)
+    assert inst._connected
+    assert not res.closed
+    assert res.writes == writes
+    assert inst.long_name == f'{idn.split(",")[1]} @ TCPIP::192.168.0.1'
@@ -0,0 +1,130 @@
+################################################################################
+# tests/test_siglent_sdl1000_measurements.py
+#
+# This file is part of the inst_conductor software suite.
+#
+# It contains tests of the SDL1000 measurement poll.
+#
+# Copyright 2022 Robert S. French (rfrench@rfrench.org)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+import collections
+
+from device.siglent_sdl1000 import (InstrumentSiglentSDL1000,
+                                    InstrumentSiglentSDL1000ConfigureWidget)
+
+
+_SDL_IDN = 'Siglent Technologies,SDL1020X-E,SDL13GCX5R0123,1.1.1.21'
+_LOAD_ON_QUERIES = {':MEAS:CURR?', ':MEAS:POW?', ':MEAS:RES?',
+                    ':TIME:TEST:RISE?', ':TIME:TEST:FALL?'}
+
+
+class FakeResource(object):
+    """A VISA resource that answers queries from a function and records them."""
+    def __init__(self, respond):
+        self.timeout = 1000
+        self.respond = respond
+        self.queries = []
+
+    def query(self, s):
+        self.queries.append(s)
+        return self.respond(s)
+
+    def write(self, s):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeLabel(object):
+    def setText(self, s):
+        pass
+
+
+def _make_widget(respond, input_state):
+    """Create an SDL configure widget with just the state the measurement poll
+    uses, connected to a FakeResource."""
+    res = FakeResource(respond)
+    inst = InstrumentSiglentSDL1000(None, 'TCPIP::192.168.0.1', existing_names=[])
+    inst.connect(resource=res, idn=_SDL_IDN)
+    widget_cls = InstrumentSiglentSDL1000ConfigureWidget
+    w = widget_cls.__new__(widget_cls)
+    w._inst = inst
+    w._param_state = {':INPUT:STATE': input_state}
+    w._widget_registry = collections.defaultdict(FakeLabel)
+    w._cur_overall_mode = 'Basic'
+    w._list_mode_running = False
+    w._batt_log_initial_voltage = None
+    w._enable_measurement_v = True
+    w._enable_measurement_c = True
+    w._enable_measurement_p = True
+    w._enable_measurement_r = True
+    w._enable_measurement_trise = True
+    w._enable_measurement_tfall = True
+    w.load_state_changes = []
+
+    def update_load_state(state, update_inst=True):
+        w.load_state_changes.append((state, update_inst))
+        w._param_state[':INPUT:STATE'] = state
+    w._update_load_state = update_load_state
+    return w, res
+
+
+def test_load_off_detected_despite_garbled_measurements():
+    # A protection trip has turned the load off, and the instrument gives a
+    # garbled reply (too many fields) to every measurement query
+    def respond(s):
+        if s == ':INPUT:STATE?':
+            return '0'
+        return ';'.join(['1.0'] * (len(s.split(';')) + 1))
+    w, res = _make_widget(respond, input_state=1)
+
+    measurements, triggers = w.update_measurements_and_triggers()
+    assert w.load_state_changes == [(0, False)]
+    assert triggers['LoadOn']['val'] is False
+    assert measurements['Voltage']['val'] is None
+
+    # Now that the load is known to be off, the load-on measurements aren't
+    # requested again
+    res.queries.clear()
+    w.update_measurements_and_triggers()
+    assert w.load_state_changes == [(0, False)]
+    assert not any(q in _LOAD_ON_QUERIES
+                   for s in res.queries for q in s.split(';'))
+
+
+def test_garbled_load_state_is_skipped():
+    w, res = _make_widget(lambda s: 'garbage', input_state=1)
+    measurements, triggers = w.update_measurements_and_triggers()
+    assert w.load_state_changes == []
+    assert triggers['LoadOn']['val'] is True
+    assert measurements['Current']['val'] is None
+
+
+def test_measurements_read_in_one_compound_query():
+    def respond(s):
+        if s == ':INPUT:STATE?':
+            return '1'
+        return ';'.join(['2.5'] * len(s.split(';')))
+    w, res = _make_widget(respond, input_state=1)
+    measurements, triggers = w.update_measurements_and_triggers()
+    # One query for the load state and one for all the measurements
+    assert len(res.queries) == 2
+    assert w.load_state_changes == []
+    assert triggers['LoadOn']['val'] is True
+    for key in ('Voltage', 'Current', 'Power', 'Resistance', 'TRise', 'TFall'):
+        assert measurements[key]['val'] == 2.5